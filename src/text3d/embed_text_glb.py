@@ -4,6 +4,7 @@ import random
 import re
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Literal, Optional
@@ -13,6 +14,8 @@ import trimesh
 
 Mode = Literal["emboss", "engrave"]
 
+_SAFE_NAME_RE = re.compile(r"[^0-9a-zA-Zก-ฮะ-๙一-龯ぁ-んァ-ンー]+")
+
 
 # -----------------------------
 # Config
@@ -29,7 +32,10 @@ class EmbedConfig:
     ray_steps: int = 40
     lift_percent: float = 1.0
 
-    # Blender (required)
+    # In-process manifold3d boolean first (falls back to Blender)
+    use_manifold: bool = True
+
+    # Blender
     blender_exe: str = r"C:\Program Files\Blender Foundation\Blender 5.0\blender.exe"
 
     # Voxel fallback (recommended)
@@ -47,11 +53,11 @@ def _remove_duplicate_faces_compat(mesh: trimesh.Trimesh) -> None:
     faces = np.asarray(getattr(mesh, "faces", None))
     if faces is None or len(faces) == 0:
         return
-    fs = np.sort(faces, axis=1)
-    _, idx = np.unique(fs, axis=0, return_index=True)
-    mask = np.zeros(len(faces), dtype=bool)
-    mask[idx] = True
-    mesh.update_faces(mask)
+    fs = np.ascontiguousarray(np.sort(faces, axis=1))
+    # view each row as one opaque item: 1D unique is much cheaper than unique(axis=0)
+    rows = fs.view(np.dtype((np.void, fs.dtype.itemsize * fs.shape[1]))).ravel()
+    _, idx = np.unique(rows, return_index=True)
+    mesh.update_faces(np.sort(idx))
 
 
 def _cleanup_mesh(mesh: trimesh.Trimesh) -> trimesh.Trimesh:
@@ -81,6 +87,20 @@ def _load_glb_as_mesh(path: str | Path) -> trimesh.Trimesh:
     return _cleanup_mesh(mesh)
 
 
+def _use_embree_ray(mesh: trimesh.Trimesh) -> trimesh.Trimesh:
+    """
+    Force the Embree ray backend (SIMD BVH traversal) when embreex is installed.
+    Falls back to trimesh's default intersector otherwise.
+    """
+    try:
+        from trimesh.ray.ray_pyembree import RayMeshIntersector
+
+        mesh.ray = RayMeshIntersector(mesh)
+    except Exception:
+        pass
+    return mesh
+
+
 def _min_bbox_size(mesh: trimesh.Trimesh) -> float:
     ext = mesh.bounds[1] - mesh.bounds[0]
     return float(np.min(ext))
@@ -91,12 +111,17 @@ def _min_bbox_size(mesh: trimesh.Trimesh) -> float:
 # -----------------------------
 def _voxel_solid_boxes(mesh: trimesh.Trimesh, pitch: float) -> trimesh.Trimesh:
     """
-    Make a very robust solid by voxelizing + fill + as_boxes.
-    as_boxes is blocky but tends to be manifold/solid.
+    Make a very robust solid by voxelizing + fill + marching cubes.
+    Only the outer surface is meshed (as_boxes emits 12 tris per filled voxel,
+    mostly interior); falls back to as_boxes without scikit-image.
     """
     m = mesh.copy()
     vg = m.voxelized(pitch).fill()
-    out = vg.as_boxes()
+    try:
+        out = vg.marching_cubes.copy()  # in voxel index space
+        out.apply_transform(vg.transform)
+    except ImportError:
+        out = vg.as_boxes()
     out = _cleanup_mesh(out)
     try:
         out.merge_vertices()
@@ -129,37 +154,39 @@ def _random_tangent_frame(n: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
     return t, b
 
 
-def _ray_hit(mesh: trimesh.Trimesh, origin: np.ndarray, direction: np.ndarray) -> Optional[np.ndarray]:
-    loc, _, _ = mesh.ray.intersects_location(
-        ray_origins=np.asarray([origin], dtype=np.float64),
-        ray_directions=np.asarray([direction], dtype=np.float64),
-        multiple_hits=False,
-    )
-    if loc is None or len(loc) == 0:
-        return None
-    return loc[0]
-
-
 def _probe_available_extent(
-    mesh: trimesh.Trimesh,
+    ray,
     p: np.ndarray,
     n: np.ndarray,
     dir_tan: np.ndarray,
     R: float,
     steps: int,
     lift: float,
-) -> float:
-    step = R / max(steps, 1)
-    best = 0.0
-    for i in range(1, steps + 1):
-        d = i * step
-        q = p + dir_tan * d
-        origin = q + n * lift
-        hit = _ray_hit(mesh, origin, -n)
-        if hit is None:
-            break
-        best = d
-    return best
+):
+    """
+    Free distance from p along dir_tan: walk `steps` points out to R and stop
+    at the first one whose downward ray misses the surface.
+    All probe rays go out in one batched query.
+    dir_tan: (3,) -> float, or (k,3) -> (k,) array (one extent per direction).
+    """
+    dirs_t = np.atleast_2d(dir_tan)
+    if steps < 1:
+        best = np.zeros(len(dirs_t))
+    else:
+        step = R / steps
+        ds = np.arange(1, steps + 1) * step
+        origins = (p + n * lift) + dirs_t[:, None, :] * ds[None, :, None]  # (k, steps, 3)
+        origins = origins.reshape(-1, 3)
+        hit = ray.intersects_any(
+            ray_origins=origins,
+            ray_directions=np.broadcast_to(-n, origins.shape),
+        ).reshape(len(dirs_t), steps)
+
+        # index of first miss == number of leading hits
+        first_miss = np.where(hit.all(axis=1), steps, np.argmin(hit, axis=1))
+        best = first_miss * step
+
+    return float(best[0]) if np.ndim(dir_tan) == 1 else best
 
 
 def estimate_patch_wh(
@@ -171,12 +198,13 @@ def estimate_patch_wh(
     R: float,
     steps: int,
     lift: float,
+    ray=None,
 ) -> tuple[float, float]:
-    tp = _probe_available_extent(mesh, p, n, t, R, steps, lift)
-    tm = _probe_available_extent(mesh, p, n, -t, R, steps, lift)
-    bp = _probe_available_extent(mesh, p, n, b, R, steps, lift)
-    bm = _probe_available_extent(mesh, p, n, -b, R, steps, lift)
-    return (tp + tm), (bp + bm)
+    # `ray`: prebuilt intersector for `mesh` (reused across placement tries)
+    if ray is None:
+        ray = mesh.ray
+    tp, tm, bp, bm = _probe_available_extent(ray, p, n, np.stack([t, -t, b, -b]), R, steps, lift)
+    return float(tp + tm), float(bp + bm)
 
 
 def _center_mesh_xy_and_zero_z(mesh: trimesh.Trimesh) -> trimesh.Trimesh:
@@ -209,22 +237,38 @@ def deform_text_mesh_to_surface(
     b: np.ndarray,
     lift: float,
     mode: Mode,
+    ray=None,
 ) -> trimesh.Trimesh:
+    if ray is None:
+        ray = base_mesh.ray
+
     m = text_mesh_local.copy()
-    v = np.asarray(m.vertices, dtype=np.float64)
-    out = np.zeros_like(v)
-
-    sign = 1.0 if mode == "emboss" else -1.0
-    for i in range(len(v)):
-        x, y, z = v[i]
-        base = p + t * x + b * y
-        origin = base + n * lift
-        hit = _ray_hit(base_mesh, origin, -n)
-        if hit is None:
-            hit = base
-        out[i] = hit + n * (sign * z)
-
-    m.vertices = out
+
+    # float32 is enough here (GLB stores float32 positions, Embree traces in float32)
+    # and halves the memory traffic of the (N,3) ray buffers
+    f32 = np.float32
+    v = np.asarray(m.vertices, dtype=f32)
+    p, n, t, b = (np.asarray(x, dtype=f32) for x in (p, n, t, b))
+
+    sign = f32(1.0 if mode == "emboss" else -1.0)
+
+    # one batched ray query for all vertices (instead of one call per vertex)
+    base = p[None, :] + np.outer(v[:, 0], t) + np.outer(v[:, 1], b)
+    origins = base + f32(lift) * n[None, :]
+    dirs = np.broadcast_to(-n, base.shape)
+    locs, idx_ray, _ = ray.intersects_location(
+        ray_origins=origins,
+        ray_directions=dirs,
+        multiple_hits=False,
+    )
+
+    # rays that miss keep the flat (planar) position
+    hit = base.copy()
+    if len(idx_ray):
+        hit[idx_ray] = locs
+
+    out = hit + (sign * v[:, 2:3]) * n[None, :]
+    m.vertices = out.astype(np.float64)
     return _cleanup_mesh(m)
 
 
@@ -337,7 +381,16 @@ if __name__ == "__main__":
 """
 
 
-def _run_blender_boolean(cfg: EmbedConfig, base: trimesh.Trimesh, tool: trimesh.Trimesh, mode: Mode) -> trimesh.Trimesh:
+def _run_blender_boolean(
+    cfg: EmbedConfig,
+    base: trimesh.Trimesh,
+    tool: trimesh.Trimesh,
+    mode: Mode,
+    base_glb: Path | None = None,
+) -> trimesh.Trimesh:
+    """
+    base_glb: optional pre-exported GLB of `base` (skips re-exporting an unchanged base).
+    """
     blender_exe = Path(cfg.blender_exe)
     if not blender_exe.exists():
         raise FileNotFoundError(f"blender.exe not found: {cfg.blender_exe}")
@@ -346,13 +399,14 @@ def _run_blender_boolean(cfg: EmbedConfig, base: trimesh.Trimesh, tool: trimesh.
 
     with tempfile.TemporaryDirectory(prefix="text3d_blender_bool_") as td:
         td = Path(td)
-        base_glb = td / "base.glb"
         tool_glb = td / "tool.glb"
         out_glb = td / "out.glb"
         script_py = td / "bool.py"
 
         # export base/tool as GLB (single mesh scene)
-        trimesh.Scene(base).export(base_glb)
+        if base_glb is None:
+            base_glb = td / "base.glb"
+            trimesh.Scene(base).export(base_glb)
         trimesh.Scene(tool).export(tool_glb)
 
         script_py.write_text(_BLENDER_BOOL_SCRIPT, encoding="utf-8")
@@ -394,6 +448,61 @@ def _run_blender_boolean(cfg: EmbedConfig, base: trimesh.Trimesh, tool: trimesh.
         return _cleanup_mesh(out_mesh)
 
 
+# -----------------------------
+# Boolean in-process via manifold3d (optional)
+# -----------------------------
+def _manifold_boolean(base: trimesh.Trimesh, tool: trimesh.Trimesh, mode: Mode) -> Optional[trimesh.Trimesh]:
+    """
+    Exact boolean with manifold3d, in milliseconds and without Blender.
+    Returns None when manifold3d is missing or an input isn't a closed manifold
+    (caller falls back to the Blender / voxel path).
+    """
+    try:
+        import manifold3d as m3
+    except ImportError:
+        return None
+
+    vis = base.visual
+    uv = getattr(vis, "uv", None) if isinstance(vis, trimesh.visual.TextureVisuals) else None
+
+    def _to_manifold(mesh: trimesh.Trimesh, uv: Optional[np.ndarray] = None):
+        props = np.asarray(mesh.vertices, dtype=np.float32)
+        if uv is not None:
+            # UVs ride along as vertex properties -> the result keeps the base texture mapping
+            props = np.hstack([props, np.asarray(uv, dtype=np.float32)])
+        faces = np.asarray(mesh.faces, dtype=np.uint32)
+        # inside-out input (e.g. the engrave tool, deformed with sign=-1) would flip
+        # the boolean: a - b would add material
+        if mesh.volume < 0:
+            faces = faces[:, ::-1]
+        mm = m3.Mesh(vert_properties=np.ascontiguousarray(props), tri_verts=np.ascontiguousarray(faces))
+        mm.merge()  # weld by position; GLB seams split by UV/normal stay as property seams
+        return m3.Manifold(mm)
+
+    a = _to_manifold(base, uv)
+    b = _to_manifold(tool)
+    if a.status() != m3.Error.NoError or b.status() != m3.Error.NoError:
+        return None
+
+    r = a + b if mode == "emboss" else a - b
+    if r.status() != m3.Error.NoError or r.is_empty():
+        return None
+
+    out = r.to_mesh()
+    props = np.asarray(out.vert_properties)
+    result = trimesh.Trimesh(vertices=props[:, :3], faces=out.tri_verts, process=False)
+
+    # keep the base look (the Blender path keeps materials too); tool faces get uv (0, 0)
+    if isinstance(vis, trimesh.visual.TextureVisuals):
+        result.visual = trimesh.visual.TextureVisuals(
+            uv=props[:, 3:5] if uv is not None else None,
+            material=vis.material.copy() if vis.material is not None else None,
+        )
+    elif vis.defined:
+        result.visual.face_colors = vis.main_color
+    return _cleanup_mesh(result)
+
+
 # -----------------------------
 # Main API
 # -----------------------------
@@ -410,7 +519,7 @@ def embed_text_on_glb(
         random.seed(seed)
         np.random.seed(seed)
 
-    base = _load_glb_as_mesh(base_glb_path)
+    base = _use_embree_ray(_load_glb_as_mesh(base_glb_path))
 
     L = _min_bbox_size(base)
     depth_world = (cfg.depth_percent / 100.0) * L
@@ -433,64 +542,92 @@ def embed_text_on_glb(
     if w2d < 1e-9 or h2d < 1e-9:
         raise ValueError("Text mesh has near-zero size; check font/text.")
 
-    for _attempt in range(cfg.tries):
-        pts, face_idx = trimesh.sample.sample_surface(base, 1)
-        p = pts[0]
-        fi = int(face_idx[0])
-        n = base.face_normals[fi]
-        n = n / (np.linalg.norm(n) + 1e-12)
-
-        t, bvec = _random_tangent_frame(n)
-        W, H = estimate_patch_wh(base, p, n, t, bvec, R=R, steps=cfg.ray_steps, lift=lift)
-
-        s_xy = cfg.margin * min(W / w2d, H / h2d)
-        if not np.isfinite(s_xy) or s_xy <= 1e-6:
-            continue
-
-        text_scaled = _scale_mesh_xy_z(text_mesh, s_xy=s_xy, s_z=depth_world)
-
-        tool = deform_text_mesh_to_surface(
-            base_mesh=base,
-            text_mesh_local=text_scaled,
-            p=p,
-            n=n,
-            t=t,
-            b=bvec,
-            lift=lift,
-            mode=cfg.mode,
-        )
+    # built once and reused by every placement try (base never changes)
+    ray = base.ray
+    face_normals = np.asarray(base.face_normals)
+    # one area-CDF build for all candidate points instead of one per try
+    try:
+        pts_all, face_idx_all = trimesh.sample.sample_surface(base, cfg.tries, seed=seed)
+    except TypeError:
+        # older trimesh has no seed= (uses the np.random state seeded above)
+        pts_all, face_idx_all = trimesh.sample.sample_surface(base, cfg.tries)
+
+    with tempfile.TemporaryDirectory(prefix="text3d_base_") as td_base:
+        base_glb_cached = Path(td_base) / "base.glb"  # exported on first Blender use
+
+        for _attempt in range(cfg.tries):
+            p = pts_all[_attempt]
+            fi = int(face_idx_all[_attempt])
+            n = face_normals[fi]
+            n = n / (np.linalg.norm(n) + 1e-12)
+
+            t, bvec = _random_tangent_frame(n)
+            W, H = estimate_patch_wh(base, p, n, t, bvec, R=R, steps=cfg.ray_steps, lift=lift, ray=ray)
+
+            s_xy = cfg.margin * min(W / w2d, H / h2d)
+            if not np.isfinite(s_xy) or s_xy <= 1e-6:
+                continue
+
+            text_scaled = _scale_mesh_xy_z(text_mesh, s_xy=s_xy, s_z=depth_world)
+
+            tool = deform_text_mesh_to_surface(
+                base_mesh=base,
+                text_mesh_local=text_scaled,
+                p=p,
+                n=n,
+                t=t,
+                b=bvec,
+                lift=lift,
+                mode=cfg.mode,
+                ray=ray,
+            )
 
-        # tiny push for stability
-        tool = tool.copy()
-        tool.apply_translation(n * (eps if cfg.mode == "emboss" else -eps))
-
-        # 1) Try blender boolean directly
-        try:
-            result = _run_blender_boolean(cfg, base, tool, cfg.mode)
-        except Exception as e1:
-            if not cfg.voxel_fallback:
-                raise RuntimeError(f"Blender boolean failed (no voxel fallback). Error:\n{e1}") from e1
-
-            # 2) Voxel solid fallback (as_boxes) then blender boolean again
-            pitch = (cfg.voxel_pitch_percent / 100.0) * L
-            base_v = _voxel_solid_boxes(base, pitch)
-            tool_v = _voxel_solid_boxes(tool, pitch)
-
-            try:
-                result = _run_blender_boolean(cfg, base_v, tool_v, cfg.mode)
-            except Exception as e2:
-                raise RuntimeError(
-                    "Blender boolean failed even after voxel solid fallback.\n"
-                    f"- direct error:\n{e1}\n"
-                    f"- voxel error:\n{e2}\n"
-                    f"Try increasing voxel_pitch_percent (e.g. 4.0, 5.0, 6.0)."
-                ) from e2
-
-        out_dir = Path("outputs") / "engrave_emboss"
-        out_dir.mkdir(parents=True, exist_ok=True)
-        safe = re.sub(r"[^0-9a-zA-Zก-ฮะ-๙一-龯ぁ-んァ-ンー]+", "_", text).strip("_")
-        out_path = out_dir / f"{Path(base_glb_path).stem}_{cfg.mode}_{cfg.depth_percent:g}pct_{safe}.glb"
-        result.export(out_path, file_type="glb")
-        return out_path
+            # tiny push for stability
+            tool = tool.copy()
+            tool.apply_translation(n * (eps if cfg.mode == "emboss" else -eps))
+
+            # 0) In-process manifold3d boolean (no subprocess / GLB round-trip)
+            result = _manifold_boolean(base, tool, cfg.mode) if cfg.use_manifold else None
+
+            # 1) Try blender boolean directly
+            if result is None:
+                try:
+                    if not base_glb_cached.exists():
+                        trimesh.Scene(base).export(base_glb_cached)
+                    result = _run_blender_boolean(cfg, base, tool, cfg.mode, base_glb=base_glb_cached)
+                except Exception as e1:
+                    if not cfg.voxel_fallback:
+                        raise RuntimeError(f"Blender boolean failed (no voxel fallback). Error:\n{e1}") from e1
+
+                    # 2) Voxel solid fallback (marching cubes): watertight inputs, so
+                    #    manifold3d first, blender boolean again only if that fails
+                    pitch = (cfg.voxel_pitch_percent / 100.0) * L
+                    with ThreadPoolExecutor(max_workers=2) as ex:
+                        fb = ex.submit(_voxel_solid_boxes, base, pitch)
+                        ft = ex.submit(_voxel_solid_boxes, tool, pitch)
+                        base_v, tool_v = fb.result(), ft.result()
+                    if isinstance(base.visual, trimesh.visual.TextureVisuals):
+                        # voxel remesh has no UVs; keep at least the base material
+                        base_v.visual = trimesh.visual.TextureVisuals(material=base.visual.material)
+
+                    result = _manifold_boolean(base_v, tool_v, cfg.mode) if cfg.use_manifold else None
+
+                    try:
+                        if result is None:
+                            result = _run_blender_boolean(cfg, base_v, tool_v, cfg.mode)
+                    except Exception as e2:
+                        raise RuntimeError(
+                            "Blender boolean failed even after voxel solid fallback.\n"
+                            f"- direct error:\n{e1}\n"
+                            f"- voxel error:\n{e2}\n"
+                            f"Try increasing voxel_pitch_percent (e.g. 4.0, 5.0, 6.0)."
+                        ) from e2
+
+            out_dir = Path("outputs") / "engrave_emboss"
+            out_dir.mkdir(parents=True, exist_ok=True)
+            safe = _SAFE_NAME_RE.sub("_", text).strip("_")
+            out_path = out_dir / f"{Path(base_glb_path).stem}_{cfg.mode}_{cfg.depth_percent:g}pct_{safe}.glb"
+            result.export(out_path, file_type="glb")
+            return out_path
 
     raise RuntimeError(f"Failed to find a placement that fits after {cfg.tries} tries.")
@@ -19,6 +19,14 @@ NLP via Ollama (optional):
     $env:TEXT3D_OLLAMA_MODEL="qwen2.5:7b-instruct"
     # optional:
     $env:TEXT3D_OLLAMA_HOST="http://127.0.0.1:11434"
+- Many prompts (prompt_to_glb_batch) are parsed concurrently; let the server
+  actually run them side by side with (set before `ollama serve`):
+    $env:OLLAMA_NUM_PARALLEL="4"
+
+- Text meshes are cached on disk (repeat prompts skip the mesh build);
+  the cache is not pruned (delete the folder to clear it).
+  Default ~/.cache/text3d, override with:
+    $env:TEXT3D_CACHE_DIR="D:/text3d_cache"
 
 - Blender path (optional for embed pipeline):
     $env:TEXT3D_BLENDER_EXE="C:\Program Files\Blender Foundation\Blender 5.0\blender.exe"
@@ -34,21 +42,29 @@ Output:
 
 from __future__ import annotations
 
+import asyncio
+import http.client
 import json
 import os
 import re
 import sys
+import threading
+import time
 import urllib.error
+import urllib.parse
 import urllib.request
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import numpy as np
-import trimesh
+try:
+    import orjson  # optional: single-pass C serializer for Ollama payloads
+except ImportError:
+    orjson = None
 
-from .text_to_mesh import text_to_mesh
-from .embed_text_glb import EmbedConfig, embed_text_on_glb
+# trimesh / mesh pipeline imports are deferred into _parsed_to_glb so that
+# usage errors, prompt parsing and font lookup don't pay their import cost.
 
 
 # -------------------------------
@@ -56,6 +72,7 @@ from .embed_text_glb import EmbedConfig, embed_text_on_glb
 # -------------------------------
 
 _QUOTE_RE = re.compile(r'"(.+?)"|“(.+?)”|\'(.+?)\'')
+_SAFE_NAME_RE = re.compile(r"[^0-9a-zA-Zก-ฮะ-๙一-龯ぁ-んァ-ンー]+")
 
 
 def parse_prompt(prompt: str) -> tuple[str, str]:
@@ -63,11 +80,14 @@ def parse_prompt(prompt: str) -> tuple[str, str]:
     Returns: (text_in_quotes, attrs_outside)
     If no quotes -> use whole prompt as text, attrs=""
     """
+    if '"' not in prompt and "“" not in prompt and "'" not in prompt:
+        return prompt.strip(), ""
+
     m = _QUOTE_RE.search(prompt)
     if not m:
         return prompt.strip(), ""
 
-    text = next(g for g in m.groups() if g is not None)
+    text = m.group(1) or m.group(2) or m.group(3)
     attrs = (prompt[: m.start()] + " " + prompt[m.end() :]).strip()
     return text.strip(), attrs.strip()
 
@@ -76,51 +96,65 @@ def parse_prompt(prompt: str) -> tuple[str, str]:
 # 2) Font selection (Thai / EN / JP)
 # -------------------------------
 
-def choose_font_for_text(text: str) -> str:
-    win_fonts = Path(r"C:\Windows\Fonts")
-    project_fonts = Path("assets") / "fonts"
-
-    def try_paths(names: list[str]) -> str | None:
-        for base in (project_fonts, win_fonts):
-            for n in names:
-                p = base / n
-                if p.exists():
-                    return str(p)
-        return None
+_RE_THAI = re.compile(r"[\u0E00-\u0E7F]")
+_RE_JP = re.compile(r"[\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFF]")  # hiragana | katakana | kanji
+
+_FONT_DIRS = (Path("assets") / "fonts", Path(r"C:\Windows\Fonts"))
+
+
+@lru_cache(maxsize=None)
+def _font_file(base: Path, name: str) -> str | None:
+    """Probe one (dir, file name); misses (None) are cached too."""
+    p = base / name
+    return str(p) if p.exists() else None
+
+
+def _try_paths(names: tuple[str, ...]) -> str | None:
+    # directory first: every bundled font in assets/fonts beats any system font
+    for base in _FONT_DIRS:
+        for n in names:
+            p = _font_file(base, n)
+            if p:
+                return p
+    return None
 
-    has_thai = any("\u0E00" <= ch <= "\u0E7F" for ch in text)
-    has_hira = any("\u3040" <= ch <= "\u309F" for ch in text)
-    has_kata = any("\u30A0" <= ch <= "\u30FF" for ch in text)
-    has_kanji = any("\u4E00" <= ch <= "\u9FFF" for ch in text)
-    has_jp = has_hira or has_kata or has_kanji
 
-    mixed_best = try_paths(
-        [
+# Font choice only depends on which scripts are present, not on the text itself.
+@lru_cache(maxsize=None)
+def _font_for_scripts(has_thai: bool, has_jp: bool) -> str:
+    mixed_best = _try_paths(
+        (
             "NotoSansCJKjp-Regular.otf",
             "NotoSansJP-Regular.otf",
             "NotoSansThai-Regular.ttf",
-        ]
+        )
     )
     if has_thai and has_jp and mixed_best:
         return mixed_best
 
     if has_thai:
-        p = try_paths(["THSarabunNew.ttf", "LeelawUI.ttf", "Leelawad.ttf"])
+        p = _try_paths(("THSarabunNew.ttf", "LeelawUI.ttf", "Leelawad.ttf"))
         if p:
             return p
 
     if has_jp:
-        p = try_paths(["YuGothM.ttc", "YuGothR.ttc", "meiryo.ttc", "MSGOTHIC.TTC", "MSMINCHO.TTC"])
+        p = _try_paths(("YuGothM.ttc", "YuGothR.ttc", "meiryo.ttc", "MSGOTHIC.TTC", "MSMINCHO.TTC"))
         if p:
             return p
 
-    p = try_paths(["BERNHC.TTF", "arial.ttf", "calibri.ttf"])
+    p = _try_paths(("BERNHC.TTF", "arial.ttf", "calibri.ttf"))
     if p:
         return p
 
     raise FileNotFoundError("No suitable font found in assets/fonts or C:\\Windows\\Fonts")
 
 
+def choose_font_for_text(text: str) -> str:
+    has_thai = bool(_RE_THAI.search(text))
+    has_jp = bool(_RE_JP.search(text))
+    return _font_for_scripts(has_thai, has_jp)
+
+
 # -------------------------------
 # 3) Options parsing (color + thickness + embed params)
 # -------------------------------
@@ -134,12 +168,31 @@ _COLOR_MAP = {
     "สีขาว": (240, 240, 240, 255),
     "สีเหลือง": (255, 220, 60, 255),
 }
+_COLOR_RE = re.compile("(" + "|".join(re.escape(k) for k in _COLOR_MAP) + ")")
+_COLOR_RANK = {k: i for i, k in enumerate(_COLOR_MAP)}  # earlier in _COLOR_MAP wins
+
+
+# Precompiled attribute patterns. Each field is searched independently
+# (a single alternation would consume spans and change which text matches).
+_DEPTH_RE = re.compile(r"(?:ลึก|depth)\s*([0-9]+(?:\.[0-9]+)?)\s*%", flags=re.IGNORECASE)
+_RGB_RE = re.compile(
+    r"rgb\s*[:=]?\s*\(?\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*\)?",
+    flags=re.IGNORECASE,
+)
+_HEX_RE = re.compile(r"(#?[0-9a-fA-F]{6})")
+_THICK_RE = re.compile(r"(หนา|ความหนา)\s*([0-9]+(?:\.[0-9]+)?)")
 
 
 def _clamp255(x: int) -> int:
     return max(0, min(255, int(x)))
 
 
+def _parse_hex(hx: str) -> tuple[int, int, int]:
+    """'#RRGGBB' or 'RRGGBB' -> (r, g, b) with a single int parse."""
+    v = int(hx.lstrip("#"), 16)
+    return (v >> 16) & 0xFF, (v >> 8) & 0xFF, v & 0xFF
+
+
 def parse_options(attrs: str) -> dict[str, Any]:
     opts: dict[str, Any] = {
         "color_rgba": (200, 200, 200, 255),
@@ -163,7 +216,7 @@ def parse_options(attrs: str) -> dict[str, Any]:
         opts["mode"] = "engrave"
 
     # depth percent: "ลึก 2%" or "depth 2%"
-    m = re.search(r"(?:ลึก|depth)\s*([0-9]+(?:\.[0-9]+)?)\s*%", a, flags=re.IGNORECASE)
+    m = _DEPTH_RE.search(a)
     if m:
         opts["depth_percent"] = float(m.group(1))
 
@@ -175,11 +228,7 @@ def parse_options(attrs: str) -> dict[str, Any]:
             break
 
     # RGB:(r,g,b)
-    m_rgb = re.search(
-        r"rgb\s*[:=]?\s*\(?\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*\)?",
-        a,
-        flags=re.IGNORECASE,
-    )
+    m_rgb = _RGB_RE.search(a)
     if m_rgb:
         r = _clamp255(int(m_rgb.group(1)))
         g = _clamp255(int(m_rgb.group(2)))
@@ -187,24 +236,18 @@ def parse_options(attrs: str) -> dict[str, Any]:
         opts["color_rgba"] = (r, g, b, 255)
 
     # HEX color #RRGGBB
-    m_hex = re.search(r"(#?[0-9a-fA-F]{6})", a)
+    m_hex = _HEX_RE.search(a)
     if m_hex:
-        hx = m_hex.group(1)
-        if not hx.startswith("#"):
-            hx = "#" + hx
-        r = int(hx[1:3], 16)
-        g = int(hx[3:5], 16)
-        b = int(hx[5:7], 16)
+        r, g, b = _parse_hex(m_hex.group(1))
         opts["color_rgba"] = (r, g, b, 255)
 
     # Thai named colors (fallback)
-    for k, rgba in _COLOR_MAP.items():
-        if k in a:
-            opts["color_rgba"] = rgba
-            break
+    names = _COLOR_RE.findall(a)
+    if names:
+        opts["color_rgba"] = _COLOR_MAP[min(names, key=_COLOR_RANK.__getitem__)]
 
     # thickness/extrude for standalone text: "หนา 8"
-    m2 = re.search(r"(หนา|ความหนา)\s*([0-9]+(?:\.[0-9]+)?)", a)
+    m2 = _THICK_RE.search(a)
     if m2:
         opts["extrude_depth"] = float(m2.group(2))
 
@@ -215,77 +258,181 @@ def parse_options(attrs: str) -> dict[str, Any]:
 # 3.5) Ollama NLP (optional)
 # -------------------------------
 
-def _ollama_chat_json(prompt: str) -> dict[str, Any] | None:
-    """
-    Call local Ollama and ask it to output STRICT JSON for text3d parsing.
+# Negative cache: once the daemon is unreachable, skip it for a while instead of
+# paying the chat timeout on every prompt.
+_OLLAMA_RETRY_S = 60.0
+_OLLAMA_DEAD_UNTIL: float = 0.0
+_OLLAMA_ALIVE_AT: float = float("-inf")  # last successful health check
 
-    Enable via env:
-      TEXT3D_USE_OLLAMA=1
-      TEXT3D_OLLAMA_HOST=http://127.0.0.1:11434
-      TEXT3D_OLLAMA_MODEL=qwen2.5:7b-instruct
-    """
+
+def _ollama_mark_dead() -> None:
+    global _OLLAMA_DEAD_UNTIL
+    _OLLAMA_DEAD_UNTIL = time.monotonic() + _OLLAMA_RETRY_S
+
+
+def _ollama_available(host: str) -> bool:
+    """Cheap GET /api/tags pre-flight (0.5s), cached both ways for _OLLAMA_RETRY_S."""
+    global _OLLAMA_ALIVE_AT
+    now = time.monotonic()
+    if now < _OLLAMA_DEAD_UNTIL:
+        return False
+    if now - _OLLAMA_ALIVE_AT < _OLLAMA_RETRY_S:
+        return True
+    try:
+        with urllib.request.urlopen(f"{host}/api/tags", timeout=0.5):
+            pass
+    except (urllib.error.URLError, TimeoutError, OSError):
+        _ollama_mark_dead()
+        return False
+    _OLLAMA_ALIVE_AT = now
+    return True
+
+
+# Output shape is enforced by Ollama's structured `format` (JSON schema),
+# so the prompt only carries the rules the schema can't express.
+_OLLAMA_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "text": {"type": "string"},
+        "mode": {"enum": ["emboss", "engrave", None]},
+        "depth_percent": {"type": ["number", "null"]},
+        "target_glb": {"type": ["string", "null"]},
+        "color_rgba": {
+            "type": ["array", "null"],
+            "items": {"type": "integer"},
+            "minItems": 4,
+            "maxItems": 4,
+        },
+        "color_hex": {"type": ["string", "null"]},
+        "extrude_depth": {"type": ["number", "null"]},
+        "target_height": {"type": ["number", "null"]},
+    },
+    "required": ["text"],
+}
+
+_OLLAMA_BATCH_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "items": {
+            "type": "array",
+            "items": {
+                **_OLLAMA_SCHEMA,
+                "properties": {"i": {"type": "integer"}, **_OLLAMA_SCHEMA["properties"]},
+                "required": ["i", "text"],
+            },
+        },
+    },
+    "required": ["items"],
+}
+
+_OLLAMA_SYSTEM = (
+    "Extract text3d CLI fields from the user's command (Thai/English).\n"
+    "- If quoted text exists, use it as text.\n"
+    "- If multiple .glb paths exist, pick the last one.\n"
+    "- If user says RGB:(r,g,b) or hex color, parse it.\n"
+    "- If user says นูน/จม -> emboss/engrave.\n"
+)
+
+_OLLAMA_BATCH_RULES = (
+    "- Input is a JSON array of {\"i\", \"p\": command}: one item per command, in order, same i.\n"
+)
+
+
+def _ollama_settings() -> tuple[str, str] | None:
+    """(host, model) when Ollama is enabled and reachable, else None."""
     use = os.environ.get("TEXT3D_USE_OLLAMA", "0")
     if use not in ("1", "true", "TRUE", "yes", "YES"):
         return None
 
     host = os.environ.get("TEXT3D_OLLAMA_HOST", "http://127.0.0.1:11434").rstrip("/")
     model = os.environ.get("TEXT3D_OLLAMA_MODEL", "qwen2.5:7b-instruct")
+    if not _ollama_available(host):
+        return None
+    return host, model
 
-    system = (
-        "You are a strict JSON parser for a CLI tool named text3d.\n"
-        "Return STRICT JSON only (no markdown, no explanation).\n"
-        "Extract fields from the user's command (Thai/English allowed).\n"
-        "Schema:\n"
-        "{\n"
-        '  "text": string,\n'
-        '  "mode": "emboss"|"engrave"|null,\n'
-        '  "depth_percent": number|null,\n'
-        '  "target_glb": string|null,\n'
-        '  "color_rgba": [r,g,b,a]|null,\n'
-        '  "color_hex": string|null,\n'
-        '  "extrude_depth": number|null,\n'
-        '  "target_height": number|null\n'
-        "}\n"
-        "Rules:\n"
-        "- If quoted text exists, use it as text.\n"
-        "- If multiple .glb paths exist, pick the last one.\n"
-        "- If user says RGB:(r,g,b) or hex color, parse it.\n"
-        "- If user says นูน/จม -> emboss/engrave.\n"
-        "- Always output a JSON object.\n"
-    )
 
-    payload = {
+def _build_ollama_payload(
+    model: str, system: str, user: str, schema: dict[str, Any]
+) -> dict[str, Any]:
+    return {
         "model": model,
-        "messages": [
-            {"role": "system", "content": system},
-            {"role": "user", "content": prompt},
-        ],
+        "system": system,
+        "prompt": user,
         "stream": False,
-        "format": "json",
+        "format": schema,
         "options": {"temperature": 0},
     }
 
-    req = urllib.request.Request(
-        url=f"{host}/api/chat",
-        data=json.dumps(payload).encode("utf-8"),
-        headers={"Content-Type": "application/json"},
-        method="POST",
-    )
 
-    try:
-        with urllib.request.urlopen(req, timeout=8) as resp:
-            data = json.loads(resp.read().decode("utf-8", errors="replace"))
-    except (urllib.error.URLError, TimeoutError, json.JSONDecodeError):
-        return None
+# Keep-alive connections, one per (thread, host): http.client objects are not
+# thread-safe and parse_prompts_async issues requests from worker threads.
+_OLLAMA_LOCAL = threading.local()
 
-    content = (data.get("message") or {}).get("content", "")
-    if not content:
+
+def _ollama_connection(host: str) -> http.client.HTTPConnection:
+    conns = getattr(_OLLAMA_LOCAL, "conns", None)
+    if conns is None:
+        conns = _OLLAMA_LOCAL.conns = {}
+    conn = conns.get(host)
+    if conn is None:
+        u = urllib.parse.urlsplit(host)
+        cls = http.client.HTTPSConnection if u.scheme == "https" else http.client.HTTPConnection
+        conn = conns[host] = cls(u.hostname, u.port)
+    return conn
+
+
+def _ollama_post(host: str, path: str, payload: dict[str, Any], timeout: float) -> dict[str, Any] | None:
+    """POST JSON over the kept-alive connection; None on transport/HTTP/JSON errors."""
+    if orjson is not None:
+        body = orjson.dumps(payload)
+    else:
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    headers = {"Content-Type": "application/json", "Content-Length": str(len(body))}
+    conn = _ollama_connection(host)
+
+    for retried in (False, True):
+        reused = conn.sock is not None
+        try:
+            conn.timeout = timeout
+            if reused:
+                conn.sock.settimeout(timeout)
+            conn.request("POST", path, body=body, headers=headers)
+            resp = conn.getresponse()
+            if resp.status != 200:
+                resp.read()  # drain so the connection stays usable
+                _ollama_mark_dead()
+                return None
+            return json.load(resp)  # decode straight from the response, no str copy
+        except ValueError:  # bad JSON / bad UTF-8
+            return None
+        except (http.client.HTTPException, OSError) as e:
+            conn.close()
+            if reused and not retried and not isinstance(e, TimeoutError):
+                continue  # server dropped the idle keep-alive socket -> reconnect once
+            _ollama_mark_dead()
+            return None
+    return None
+
+
+def _ollama_generate(
+    host: str, model: str, system: str, user: str, schema: dict[str, Any], timeout: float = 8
+) -> str | None:
+    """POST one /api/generate request; returns the model's response text or None."""
+    payload = _build_ollama_payload(model, system, user, schema)
+    data = _ollama_post(host, "/api/generate", payload, timeout)
+    if not isinstance(data, dict):
         return None
+    return data.get("response") or None
 
+
+def _loads_json_object(content: str) -> dict[str, Any] | None:
     try:
         obj = json.loads(content)
         return obj if isinstance(obj, dict) else None
     except json.JSONDecodeError:
+        # format= already constrains the output; only salvage small replies
+        if len(content) >= 4096:
+            return None
         m = re.search(r"\{.*\}", content, flags=re.DOTALL)
         if not m:
             return None
@@ -296,75 +443,236 @@ def _ollama_chat_json(prompt: str) -> dict[str, Any] | None:
             return None
 
 
+def _ollama_chat_json(prompt: str) -> dict[str, Any] | None:
+    """
+    Call local Ollama and ask it to output STRICT JSON for text3d parsing.
+
+    Enable via env:
+      TEXT3D_USE_OLLAMA=1
+      TEXT3D_OLLAMA_HOST=http://127.0.0.1:11434
+      TEXT3D_OLLAMA_MODEL=qwen2.5:7b-instruct
+    """
+    settings = _ollama_settings()
+    if settings is None:
+        return None
+
+    content = _ollama_generate(*settings, _OLLAMA_SYSTEM, prompt, _OLLAMA_SCHEMA)
+    if not content:
+        return None
+    return _loads_json_object(content)
+
+
+def _ollama_chat_json_batch(prompts: list[str]) -> list[dict[str, Any] | None] | None:
+    """
+    Parse several prompts in ONE /api/generate round-trip.
+    Returns one entry per prompt (None where the model gave nothing usable),
+    or None if Ollama is disabled/unreachable or the reply is malformed.
+    """
+    settings = _ollama_settings()
+    if settings is None:
+        return None
+
+    user = json.dumps([{"i": i, "p": p} for i, p in enumerate(prompts)], ensure_ascii=False)
+    # generation time grows with the number of objects to emit
+    content = _ollama_generate(
+        *settings, _OLLAMA_SYSTEM + _OLLAMA_BATCH_RULES, user, _OLLAMA_BATCH_SCHEMA, timeout=8 * len(prompts)
+    )
+    if not content:
+        return None
+
+    try:
+        arr = json.loads(content)
+    except json.JSONDecodeError:
+        return None
+    if isinstance(arr, dict):
+        arr = arr.get("items")
+    if not isinstance(arr, list):
+        return None
+
+    out: list[dict[str, Any] | None] = [None] * len(prompts)
+    for pos, obj in enumerate(arr):
+        if not isinstance(obj, dict):
+            continue
+        i = obj.get("i", pos)
+        if isinstance(i, int) and 0 <= i < len(prompts) and out[i] is None:
+            out[i] = obj
+    return out
+
+
+def _opts_from_ollama(obj: dict[str, Any]) -> tuple[str, dict[str, Any]] | None:
+    """Map an Ollama JSON object onto parse_options() defaults; None if it has no text."""
+    text = str(obj.get("text") or "").strip()
+    if not text:
+        return None
+
+    opts = parse_options("")  # start from defaults
+
+    mode = obj.get("mode")
+    if mode in ("emboss", "engrave"):
+        opts["mode"] = mode
+
+    dp = obj.get("depth_percent")
+    if dp is not None:
+        try:
+            opts["depth_percent"] = float(dp)
+        except Exception:
+            pass
+
+    tg = obj.get("target_glb")
+    if isinstance(tg, str) and ".glb" in tg.lower():
+        opts["target_glb"] = tg.strip()
+
+    rgba = obj.get("color_rgba")
+    if isinstance(rgba, list) and len(rgba) == 4:
+        try:
+            opts["color_rgba"] = tuple(_clamp255(int(x)) for x in rgba)
+        except Exception:
+            pass
+    else:
+        hx = obj.get("color_hex")
+        if isinstance(hx, str) and re.fullmatch(r"#?[0-9a-fA-F]{6}", hx.strip()):
+            r, g, b = _parse_hex(hx.strip())
+            opts["color_rgba"] = (r, g, b, 255)
+
+    ex = obj.get("extrude_depth")
+    if ex is not None:
+        try:
+            opts["extrude_depth"] = float(ex)
+        except Exception:
+            pass
+
+    th = obj.get("target_height")
+    if th is not None:
+        try:
+            opts["target_height"] = float(th)
+        except Exception:
+            pass
+
+    return text, opts
+
+
+def _regex_sufficient(prompt: str) -> bool:
+    """
+    Quoted text + an explicit color (name / RGB / hex) outside the quotes:
+    the regex parser extracts everything, so the LLM round-trip is skipped.
+    """
+    m = _QUOTE_RE.search(prompt)
+    if not m:
+        return False
+    attrs = prompt[: m.start()] + " " + prompt[m.end() :]
+    if _COLOR_RE.search(attrs):
+        return True
+    return bool(_RGB_RE.search(attrs) or _HEX_RE.search(attrs))
+
+
+def _parse_with_regex(prompt: str) -> tuple[str, dict[str, Any], str]:
+    text, attrs = parse_prompt(prompt)
+    opts = parse_options(attrs)
+    return text, opts, attrs
+
+
+def _merge_parsed(
+    prompts: list[str], objs: list[dict[str, Any] | None]
+) -> list[tuple[str, dict[str, Any], str]]:
+    """Use each Ollama object when it has text, else regex-parse that prompt."""
+    results = []
+    for prompt, obj in zip(prompts, objs):
+        parsed = _opts_from_ollama(obj) if isinstance(obj, dict) else None
+        if parsed:
+            results.append((parsed[0], parsed[1], ""))
+        else:
+            results.append(_parse_with_regex(prompt))
+    return results
+
+
 def parse_prompt_and_options(prompt: str) -> tuple[str, dict[str, Any], str]:
     """
     Returns: (text, opts, attrs)
     Tries Ollama first (if enabled), fallback to regex parsing.
     """
+    if _regex_sufficient(prompt):
+        return _parse_with_regex(prompt)
+
     obj = _ollama_chat_json(prompt)
     if isinstance(obj, dict):
-        text = str(obj.get("text") or "").strip()
-        if text:
-            opts = parse_options("")  # start from defaults
-
-            mode = obj.get("mode")
-            if mode in ("emboss", "engrave"):
-                opts["mode"] = mode
-
-            dp = obj.get("depth_percent")
-            if dp is not None:
-                try:
-                    opts["depth_percent"] = float(dp)
-                except Exception:
-                    pass
-
-            tg = obj.get("target_glb")
-            if isinstance(tg, str) and ".glb" in tg.lower():
-                opts["target_glb"] = tg.strip()
-
-            rgba = obj.get("color_rgba")
-            if isinstance(rgba, list) and len(rgba) == 4:
-                try:
-                    opts["color_rgba"] = tuple(_clamp255(int(x)) for x in rgba)
-                except Exception:
-                    pass
-            else:
-                hx = obj.get("color_hex")
-                if isinstance(hx, str) and re.fullmatch(r"#?[0-9a-fA-F]{6}", hx.strip()):
-                    hx = hx.strip()
-                    if not hx.startswith("#"):
-                        hx = "#" + hx
-                    r = int(hx[1:3], 16)
-                    g = int(hx[3:5], 16)
-                    b = int(hx[5:7], 16)
-                    opts["color_rgba"] = (r, g, b, 255)
-
-            ex = obj.get("extrude_depth")
-            if ex is not None:
-                try:
-                    opts["extrude_depth"] = float(ex)
-                except Exception:
-                    pass
-
-            th = obj.get("target_height")
-            if th is not None:
-                try:
-                    opts["target_height"] = float(th)
-                except Exception:
-                    pass
-
+        parsed = _opts_from_ollama(obj)
+        if parsed:
+            text, opts = parsed
             return text, opts, ""  # attrs empty because structured
 
     # fallback old behavior
-    text, attrs = parse_prompt(prompt)
-    opts = parse_options(attrs)
-    return text, opts, attrs
+    return _parse_with_regex(prompt)
+
+
+def parse_prompts_and_options(prompts: list[str]) -> list[tuple[str, dict[str, Any], str]]:
+    """
+    Batch version of parse_prompt_and_options: all prompts go to Ollama in one
+    request; any prompt it can't handle falls back to regex parsing individually.
+    """
+    if len(prompts) <= 1:
+        return [parse_prompt_and_options(p) for p in prompts]
+
+    objs: list[dict[str, Any] | None] = [None] * len(prompts)
+    todo = [i for i, p in enumerate(prompts) if not _regex_sufficient(p)]
+    if len(todo) == 1:
+        objs[todo[0]] = _ollama_chat_json(prompts[todo[0]])
+    elif todo:
+        got = _ollama_chat_json_batch([prompts[i] for i in todo]) or []
+        for i, obj in zip(todo, got):
+            objs[i] = obj
+    return _merge_parsed(prompts, objs)
+
+
+async def _ollama_chat_json_async(prompt: str) -> dict[str, Any] | None:
+    if _regex_sufficient(prompt):
+        return None
+    # http.client is blocking -> run it on a worker thread so requests overlap
+    return await asyncio.to_thread(_ollama_chat_json, prompt)
+
+
+async def parse_prompts_async(prompts: list[str]) -> list[tuple[str, dict[str, Any], str]]:
+    """
+    Independent Ollama parses fired concurrently (one request per prompt).
+    Speedup is bounded by the server's OLLAMA_NUM_PARALLEL.
+    """
+    objs = await asyncio.gather(*[_ollama_chat_json_async(p) for p in prompts])
+    return _merge_parsed(prompts, objs)
 
 
 # -------------------------------
 # 4) Main: prompt -> GLB
 # -------------------------------
 
+# Per-process caches for batch runs: one material per color, one mkdir per dir.
+# per-color template materials; never handed out directly (see _material_for)
+_MAT_CACHE: dict[tuple[int, int, int, int], Any] = {}
+_OUT_DIRS_READY: set[Path] = set()
+
+
+def _material_for(color_rgba: tuple[int, int, int, int]) -> Any:
+    """Fresh PBRMaterial per mesh (copied from a cached template, so callers may mutate it)."""
+    mat = _MAT_CACHE.get(color_rgba)
+    if mat is None:
+        import trimesh
+
+        r, g, b, a = color_rgba
+        mat = _MAT_CACHE[color_rgba] = trimesh.visual.material.PBRMaterial(
+            baseColorFactor=(r / 255.0, g / 255.0, b / 255.0, a / 255.0),
+            metallicFactor=0.0,
+            roughnessFactor=0.6,
+        )
+    return mat.copy()
+
+
+def _ensure_dir(path: Path) -> Path:
+    key = path.absolute()
+    if key not in _OUT_DIRS_READY:
+        path.mkdir(parents=True, exist_ok=True)
+        _OUT_DIRS_READY.add(key)
+    return path
+
+
+@lru_cache(maxsize=128)
 def auto_font_size(base: int, text: str, min_scale: float = 0.6, max_scale: float = 1.4) -> int:
     n = max(len(text), 1)
     scale = 8.0 / n
@@ -374,7 +682,16 @@ def auto_font_size(base: int, text: str, min_scale: float = 0.6, max_scale: floa
 
 def prompt_to_glb(prompt: str) -> Path:
     text, opts, attrs = parse_prompt_and_options(prompt)
+    return _parsed_to_glb(text, opts, attrs)
+
+
+def prompt_to_glb_batch(prompts: list[str]) -> list[Path]:
+    """Parse all prompts concurrently, then build the GLBs one by one."""
+    parsed = asyncio.run(parse_prompts_async(prompts))
+    return [_parsed_to_glb(text, opts, attrs) for text, opts, attrs in parsed]
 
+
+def _parsed_to_glb(text: str, opts: dict[str, Any], attrs: str) -> Path:
     print(f"[INFO] Parsed text: {text!r}")
     print(f"[INFO] Attrs: {attrs!r}")
     print(f"[INFO] Options: {opts}")
@@ -382,12 +699,16 @@ def prompt_to_glb(prompt: str) -> Path:
     font_path = choose_font_for_text(text)
     print(f"[INFO] Using font: {font_path}")
 
+    from .text_to_mesh import text_to_mesh
+
     base_font = 900
     fs = auto_font_size(base_font, text)
     print(f"[INFO] auto font_size = {fs} (from base {base_font})")
 
     # -------- Embed mode (engrave/emboss) --------
     if opts.get("target_glb") and opts.get("mode") and (opts.get("depth_percent") is not None):
+        from .embed_text_glb import EmbedConfig, embed_text_on_glb
+
         blender_exe = os.environ.get("TEXT3D_BLENDER_EXE")
         if blender_exe:
             cfg = EmbedConfig(
@@ -411,6 +732,7 @@ def prompt_to_glb(prompt: str) -> Path:
                 extrude_depth=float(extrude_depth),
                 simplify_tol=0.3,
                 target_height=float(target_height),
+                use_cache=True,
             )
 
         out_path = embed_text_on_glb(
@@ -434,20 +756,14 @@ def prompt_to_glb(prompt: str) -> Path:
         extrude_depth=float(opts["extrude_depth"]),
         simplify_tol=0.3,
         target_height=float(opts["target_height"]),
+        use_cache=True,
     )
 
-    r, g, b, a = opts["color_rgba"]
-    mat = trimesh.visual.material.PBRMaterial(
-        baseColorFactor=(r / 255.0, g / 255.0, b / 255.0, a / 255.0),
-        metallicFactor=0.0,
-        roughnessFactor=0.6,
-    )
-    mesh.visual.material = mat
+    mesh.visual.material = _material_for(tuple(opts["color_rgba"]))
 
-    safe = re.sub(r"[^0-9a-zA-Zก-ฮะ-๙一-龯ぁ-んァ-ンー]+", "_", text).strip("_")
+    safe = _SAFE_NAME_RE.sub("_", text).strip("_")
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-    out_dir = Path("outputs") / "meshes"
-    out_dir.mkdir(parents=True, exist_ok=True)
+    out_dir = _ensure_dir(Path("outputs") / "meshes")
     out_path = out_dir / f"text_{safe}_{ts}.glb"
 
     mesh.export(out_path, file_type="glb")
@@ -9,22 +9,44 @@ Pipeline:
   5) Planar UV (x,y -> u,v in [0,1])
   6) Normalize height (Y axis) for consistent sizing
 
+Optional (use_cache=True):
+  Finished meshes are kept on disk (~/.cache/text3d, or $TEXT3D_CACHE_DIR),
+  keyed by text + all geometry settings + font files (incl. fallbacks) mtime.
+  The cache is never pruned; delete the folder to clear it.
+
+Optional (vector_outlines=True):
+  Glyph outlines are read directly from the font with freetype-py
+  (Bezier -> polyline), skipping steps 1-2. Thai / missing glyphs fall back
+  to the bitmap path.
+
 Deps:
   pip install numpy pillow opencv-python shapely trimesh mapbox-earcut
+  pip install freetype-py  (optional)
 """
 
 from __future__ import annotations
 
+import hashlib
+import math
 import os
+import tempfile
+import zipfile
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Tuple
 
 import numpy as np
 import cv2
 import trimesh
 from PIL import Image, ImageDraw, ImageFont
+import shapely
 from shapely.geometry import Polygon, MultiPolygon
-from shapely.ops import unary_union
+from mapbox_earcut import triangulate_float64
+
+try:
+    import freetype  # optional: pip install freetype-py
+except ImportError:  # pragma: no cover
+    freetype = None
 
 
 # ---------------------------------------------------------
@@ -38,8 +60,15 @@ class TextToMeshConfig:
     image_size: Tuple[int, int] = (1024, 1024)  # (W, H)
     extrude_depth: float = 1.0
     threshold: int = 128
-    simplify_tol: float = 0.5
+    simplify_tol: float = 0.5  # min approxPolyDP epsilon (pixels)
     invert_y: bool = True  # convert image coords -> cartesian
+    force_union: bool = False  # union glyph polygons (outer contours are already disjoint)
+    debug: bool = False  # write debug_bitmap.png / debug_contours.png
+    morph_close: bool = False  # 3x3 MORPH_CLOSE on the mask before tracing (opt-in)
+    vector_outlines: bool = False  # read glyph outlines via freetype-py (no bitmap)
+    use_cache: bool = False  # reuse finished meshes from the on-disk cache
+    fit_to_image: bool = True  # shrink font_size to fit image_size (False: render at font_size)
+    holes: bool = True  # keep counters (O, A, ...); False = outer outlines only (solid glyphs)
 
 
 # ---------------------------------------------------------
@@ -47,6 +76,11 @@ class TextToMeshConfig:
 # ---------------------------------------------------------
 from pathlib import Path
 
+@lru_cache(maxsize=64)
+def _font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    # parsing a TTF is expensive; reuse faces across fit passes and calls
+    return ImageFont.truetype(path, size)
+
 def _char_script(ch: str) -> str:
     o = ord(ch)
     if 0x0E00 <= o <= 0x0E7F:
@@ -55,43 +89,34 @@ def _char_script(ch: str) -> str:
         return "jp"
     return "latin"
 
+# fallback fonts per script (Windows Fonts), เรียงตามความชัวร์
+_WIN_FONTS = Path(r"C:\Windows\Fonts")
+_SCRIPT_FONT_CANDIDATES = {
+    "jp": ["YuGothM.ttc", "YuGothR.ttc", "meiryo.ttc", "MSGOTHIC.TTC"],
+    "thai": ["LeelawUI.ttf", "Leelawad.ttf", "THSarabunNew.ttf", "AngsanaUPC.ttf"],
+    "latin": ["arial.ttf", "calibri.ttf"],
+}
+
+# resolved once at import: script -> first existing fallback path (or None)
+_SCRIPT_FONT = {
+    script: next((str(p) for p in (_WIN_FONTS / n for n in names) if p.exists()), None)
+    for script, names in _SCRIPT_FONT_CANDIDATES.items()
+}
+
+@lru_cache(maxsize=64)
+def _path_exists(path: str) -> bool:
+    return bool(path) and os.path.exists(path)
+
 def _pick_font_path_for_char(ch: str, primary_font_path: str) -> str:
     """
     เลือก font ต่อ 1 ตัวอักษร (ชัวร์สุด)
     - ใช้ primary_font_path ก่อน
     - ถ้าเป็น JP/TH ให้ลองฟอนต์ของภาษา (Windows Fonts)
     """
-    win = Path(r"C:\Windows\Fonts")
-    script = _char_script(ch)
-
-    # เรียงลำดับความชัวร์: primary ก่อน แล้วค่อย fallback ตามภาษา
-    candidates = [primary_font_path]
-
-    if script == "jp":
-        candidates += [
-            str(win / "YuGothM.ttc"),
-            str(win / "YuGothR.ttc"),
-            str(win / "meiryo.ttc"),
-            str(win / "MSGOTHIC.TTC"),
-        ]
-    elif script == "thai":
-        candidates += [
-            str(win / "LeelawUI.ttf"),
-            str(win / "Leelawad.ttf"),
-            str(win / "THSarabunNew.ttf"),
-            str(win / "AngsanaUPC.ttf"),
-        ]
-    else:
-        candidates += [
-            str(win / "arial.ttf"),
-            str(win / "calibri.ttf"),
-        ]
-
-    # เอาอันที่มีอยู่จริงตัวแรก
-    for p in candidates:
-        if p and os.path.exists(p):
-            return p
-    return primary_font_path
+    # primary ก่อน แล้วค่อย fallback ตามภาษา (ตาราง _SCRIPT_FONT, ไม่ stat ต่อตัวอักษร)
+    if _path_exists(primary_font_path):
+        return primary_font_path
+    return _SCRIPT_FONT[_char_script(ch)] or primary_font_path
 
 def _measure_mixed_text(draw: ImageDraw.ImageDraw, text: str, font_size: int, primary_font_path: str):
     """
@@ -99,12 +124,8 @@ def _measure_mixed_text(draw: ImageDraw.ImageDraw, text: str, font_size: int, pr
     คืนค่า (total_w, total_h, min_y, max_y, runs)
     runs = list[(ch, font_obj, advance)]
     """
-    font_cache = {}
     def get_font(path: str):
-        key = (path, font_size)
-        if key not in font_cache:
-            font_cache[key] = ImageFont.truetype(path, font_size)
-        return font_cache[key]
+        return _font(path, font_size)
 
     x = 0.0
     min_y = 0.0
@@ -138,31 +159,29 @@ def _measure_mixed_text(draw: ImageDraw.ImageDraw, text: str, font_size: int, pr
     total_h = max_y - min_y
     return total_w, total_h, min_y, max_y, runs
 
-import hashlib
 from PIL import Image, ImageDraw, ImageFont
 
-def _font_notdef_hash(font: ImageFont.FreeTypeFont, size: int = 64) -> str:
+def _glyph_signature(font: ImageFont.FreeTypeFont, ch: str) -> tuple[tuple[int, int], bytes]:
+    # raw coverage mask (size + bytes): exact compare, no canvas / draw / MD5 per char
+    m = font.getmask(ch)
+    return m.size, bytes(m)
+
+@lru_cache(maxsize=64)
+def _font_notdef_signature(font: ImageFont.FreeTypeFont) -> tuple[tuple[int, int], bytes]:
     """
     สร้าง signature ของ glyph .notdef (ตัวที่ใช้แทนตอน font ไม่มี glyph)
     ใช้ตรวจว่า char นั้นๆ เป็น "กล่อง" เพราะไม่มี glyph หรือเปล่า
+    (คำนวณครั้งเดียวต่อ font object)
     """
     # ใช้ private-use char ที่แทบไม่มีฟอนต์ไหนมีจริง → จะได้ .notdef แน่นอน
-    ch = "\uE000"
-    img = Image.new("L", (size, size), 0)
-    d = ImageDraw.Draw(img)
-    d.text((0, 0), ch, fill=255, font=font)
-    return hashlib.md5(img.tobytes()).hexdigest()
+    return _glyph_signature(font, "\uE000")
 
-def _char_supported(font: ImageFont.FreeTypeFont, notdef_hash: str, ch: str) -> bool:
+def _char_supported(font: ImageFont.FreeTypeFont, ch: str) -> bool:
     """
-    เรนเดอร์ตัวอักษรลงภาพเล็กๆ แล้วเทียบกับ .notdef
+    เทียบ mask ของตัวอักษรกับ .notdef
     ถ้าเหมือนกัน → ไม่มี glyph จริง (มักเป็นกล่อง)
     """
-    img = Image.new("L", (64, 64), 0)
-    d = ImageDraw.Draw(img)
-    d.text((0, 0), ch, fill=255, font=font)
-    h = hashlib.md5(img.tobytes()).hexdigest()
-    return h != notdef_hash
+    return _glyph_signature(font, ch) != _font_notdef_signature(font)
 
 def _is_thai(ch: str) -> bool:
     return "\u0E00" <= ch <= "\u0E7F"
@@ -177,11 +196,66 @@ def _is_japanese(ch: str) -> bool:
     )
 
 
-def _pick_existing_font(candidates: list[str]) -> str | None:
-    for p in candidates:
-        if os.path.exists(p):
-            return p
-    return None
+@lru_cache(maxsize=8192)
+def _advance(font: ImageFont.FreeTypeFont, ch: str) -> float:
+    # font objects are shared via _font(), so (font, ch) is a stable key across calls
+    # ความกว้าง: ใช้ getlength ถ้ามี (Pillow ใหม่) ไม่งั้น fallback bbox
+    if hasattr(font, "getlength"):
+        return float(font.getlength(ch))
+    bx = font.getbbox(ch)
+    return float((bx[2] - bx[0]) if bx else 0)
+
+
+@lru_cache(maxsize=8192)
+def _ink_bbox(font: ImageFont.FreeTypeFont, ch: str):
+    # (left, top, right, bottom) of the glyph ink relative to a top-left draw origin
+    return font.getbbox(ch)
+
+
+def _script_fonts(size: int, latin_path: str, thai_path: str | None, jp_path: str | None):
+    latin = _font(latin_path, size)
+
+    # ถ้าเครื่องไม่มีฟอนต์ fallback ก็ใช้ latin ไปก่อน (ยังไม่พัง)
+    thai = _font(thai_path, size) if thai_path else latin
+    jp = _font(jp_path, size) if jp_path else latin
+
+    return latin, thai, jp
+
+
+def _font_for_char(ch: str, latin, thai, jp):
+    if _is_japanese(ch):
+        return jp
+    if _is_thai(ch):
+        return thai
+    return latin
+
+
+def _measure_line(text: str, latin, thai, jp):
+    """
+    วัด width แบบต่อ char + หาค่าสูงแบบ baseline รวม
+    คืนค่า (total_w, max_ascent, max_descent, glyphs)
+    glyphs = list[(ch, font, ascent, advance)] -> ใช้วาดต่อได้เลย ไม่ต้องวัดซ้ำ
+    """
+    total_w = 0.0
+    max_ascent = 0
+    max_descent = 0
+    metrics: dict = {}
+    glyphs = []
+
+    for ch in text:
+        f = _font_for_char(ch, latin, thai, jp)
+        m = metrics.get(f)
+        if m is None:
+            m = metrics[f] = f.getmetrics()
+        a, d = m
+        max_ascent = max(max_ascent, a)
+        max_descent = max(max_descent, d)
+
+        adv = _advance(f, ch)
+        total_w += adv
+        glyphs.append((ch, f, a, adv))
+
+    return total_w, max_ascent, max_descent, glyphs
 
 
 def text_to_bitmap(text: str, cfg: TextToMeshConfig) -> np.ndarray:
@@ -189,203 +263,422 @@ def text_to_bitmap(text: str, cfg: TextToMeshConfig) -> np.ndarray:
     Multi-font per-character fallback (Thai/English/Japanese) + shared baseline.
     - แก้ปัญหา ญี่ปุ่นเป็นกล่อง (เลือก YuGothM.ttc ต่อ “ตัวอักษร”)
     - แก้ปัญหา ไทย/อังกฤษ/ญี่ปุ่น สูงไม่เท่ากัน (ใช้ baseline เดียว)
-    - ย่อ font_size อัตโนมัติถ้าข้อความล้นภาพ
+    - ย่อ font_size อัตโนมัติถ้าข้อความล้นภาพ (ปิดได้ด้วย cfg.fit_to_image=False:
+      วาดที่ font_size เดิมเสมอ, image_size ไม่มีผล)
+    - คืน bitmap เฉพาะบริเวณที่มีตัวอักษร (crop จากกรอบ W×H, ไม่ใช่ทั้งกรอบ)
     """
     W, H = cfg.image_size
 
-    win_fonts = r"C:\Windows\Fonts"
-    jp_font_path = _pick_existing_font([
-        os.path.join(win_fonts, "YuGothM.ttc"),
-        os.path.join(win_fonts, "YuGothR.ttc"),
-        os.path.join(win_fonts, "meiryo.ttc"),
-        os.path.join(win_fonts, "MSGOTHIC.TTC"),
-    ])
-    thai_font_path = _pick_existing_font([
-        os.path.join(win_fonts, "LeelawUI.ttf"),
-        os.path.join(win_fonts, "THSarabunNew.ttf"),
-        os.path.join(win_fonts, "AngsanaUPC.ttf"),
-    ])
+    # fallback fonts were resolved once at import (no stat per call)
+    jp_font_path = _SCRIPT_FONT["jp"]
+    thai_font_path = _SCRIPT_FONT["thai"]
 
     # latin = cfg.font_path (ของเดิม) เป็น default
     latin_font_path = cfg.font_path
 
-    # ---------- helper: layout metrics ----------
-    def build_fonts(size: int):
-        latin = ImageFont.truetype(latin_font_path, size)
-
-        # ถ้าเครื่องไม่มีฟอนต์ fallback ก็ใช้ latin ไปก่อน (ยังไม่พัง)
-        thai = ImageFont.truetype(thai_font_path, size) if thai_font_path else latin
-        jp = ImageFont.truetype(jp_font_path, size) if jp_font_path else latin
-
-        return latin, thai, jp
-
-    def font_for_char(ch: str, latin, thai, jp):
-        if _is_japanese(ch):
-            return jp
-        if _is_thai(ch):
-            return thai
-        return latin
-
-    def measure(text_: str, latin, thai, jp):
-        # วัด width แบบต่อ char + หาค่าสูงแบบ baseline รวม
-        total_w = 0.0
-        max_ascent = 0
-        max_descent = 0
-
-        for ch in text_:
-            f = font_for_char(ch, latin, thai, jp)
-            a, d = f.getmetrics()
-            max_ascent = max(max_ascent, a)
-            max_descent = max(max_descent, d)
-
-            # ความกว้าง: ใช้ getlength ถ้ามี (Pillow ใหม่) ไม่งั้น fallback bbox
-            if hasattr(f, "getlength"):
-                total_w += float(f.getlength(ch))
-            else:
-                bx = f.getbbox(ch)
-                total_w += float((bx[2] - bx[0]) if bx else 0)
-
-        total_h = max_ascent + max_descent
-        return total_w, total_h, max_ascent, max_descent
+    def measure(size: int):
+        fonts = _script_fonts(size, latin_font_path, thai_font_path, jp_font_path)
+        total_w, max_ascent, max_descent, glyphs = _measure_line(text, *fonts)
+        return total_w, max_ascent + max_descent, max_ascent, max_descent, glyphs
 
     # ---------- auto-fit font size ----------
+    # text extent scales ~linearly with font size -> solve the fitting size
+    # from one measurement instead of shrinking step by step
     font_size = cfg.font_size
     max_w = W * 0.90
     max_h = H * 0.90
 
-    while True:
-        latin, thai, jp = build_fonts(font_size)
-        text_w, text_h, max_ascent, max_descent = measure(text, latin, thai, jp)
+    text_w, text_h, max_ascent, max_descent, glyphs = measure(font_size)
 
-        if text_w <= max_w and text_h <= max_h:
-            break
-
-        # scale down
+    if not cfg.fit_to_image:
+        # fixed font_size: the frame just has to hold the line (+ one em of margin
+        # for overhanging marks/bearings); only the ink crop below is allocated
+        W = math.ceil(text_w) + 2 * font_size
+        H = math.ceil(text_h) + 2 * font_size
+    elif text_w > max_w or text_h > max_h:
         scale_w = max_w / text_w if text_w > 1e-6 else 1.0
         scale_h = max_h / text_h if text_h > 1e-6 else 1.0
-        scale = min(scale_w, scale_h)
-
-        new_size = int(font_size * scale)
-        if new_size >= font_size:
-            new_size = font_size - 1
+        font_size = max(10, min(font_size - 1, int(font_size * min(scale_w, scale_h))))
+        text_w, text_h, max_ascent, max_descent, glyphs = measure(font_size)
 
-        if new_size < 10:
-            font_size = 10
-            latin, thai, jp = build_fonts(font_size)
-            text_w, text_h, max_ascent, max_descent = measure(text, latin, thai, jp)
-            break
-
-        font_size = new_size
+        # hinting can round metrics up: verify and step down until it fits
+        while (text_w > max_w or text_h > max_h) and font_size > 10:
+            font_size -= 1
+            text_w, text_h, max_ascent, max_descent, glyphs = measure(font_size)
 
     # ---------- render ----------
-    img = Image.new("L", (W, H), color=0)
-    draw = ImageDraw.Draw(img)
-
     # baseline-centered:
     # top = yb - max_ascent, bottom = yb + max_descent
     # center -> (top+bottom)/2 = H/2
     yb = (H + max_ascent - max_descent) / 2.0
 
-    x = (W - text_w) / 2.0
-
-    for ch in text:
-        f = font_for_char(ch, latin, thai, jp)
-        a, _ = f.getmetrics()
-
-        # วาดด้วย “top-left” => y_top = baseline - ascent
-        draw.text((x, yb - a), ch, fill=255, font=f)
-
-        if hasattr(f, "getlength"):
-            x += float(f.getlength(ch))
-        else:
-            bx = f.getbbox(ch)
-            x += float((bx[2] - bx[0]) if bx else 0)
-
-    return np.array(img)
+    if not glyphs:
+        return np.zeros((1, 1), dtype=np.uint8)
+
+    # layout in frame coords, as arrays (cumsum adds left to right like x += adv,
+    # so positions are bit-identical to the per-glyph loop)
+    chars, fonts, asc, advs = zip(*glyphs)
+    xs = np.cumsum(((W - text_w) / 2.0,) + advs)[:-1]
+    # วาดด้วย “top-left” => y_top = baseline - ascent
+    ys = yb - np.asarray(asc, dtype=np.float64)
+
+    # union of glyph ink boxes and draw origins
+    # (origins must stay >= 0 in the crop: Pillow splits negative positions differently)
+    ink = np.array([_ink_bbox(f, ch) for ch, f in zip(chars, fonts)], dtype=np.float64)
+    left = min((xs + ink[:, 0]).min(), xs.min())
+    top = min((ys + ink[:, 1]).min(), ys.min())
+    right = (xs + ink[:, 2]).max()
+    bottom = (ys + ink[:, 3]).max()
+
+    # Only the ink window (clipped to the W x H frame) is rasterized and traced.
+    # The crop offset is integral so glyph rasterization is unchanged; the mesh
+    # is re-centered later, so the translation doesn't matter.
+    pad = 2
+    x0 = max(0, math.floor(left) - pad)
+    y0 = max(0, math.floor(top) - pad)
+    x1 = min(W, math.ceil(right) + pad)
+    y1 = min(H, math.ceil(bottom) + pad)
+
+    buf = np.zeros((max(1, y1 - y0), max(1, x1 - x0)), dtype=np.uint8)
+    for x, y, ch, f in zip(xs.tolist(), ys.tolist(), chars, fonts):
+        _blit_glyph(buf, f, ch, x - x0, y - y0)
+
+    return buf
+
+
+def _mask_array(mask) -> np.ndarray:
+    """Pillow core image (from getmask2) -> (h, w) uint8 array."""
+    try:
+        # wrap the core image (no pixel copy) so numpy reads it via tobytes;
+        # Image._new is private, hence the fallback below
+        return np.asarray(Image.Image()._new(mask))
+    except (AttributeError, TypeError, ValueError):
+        # public path; bytes(core) walks the pixels one by one, so it is slower
+        return np.frombuffer(bytes(mask), np.uint8).reshape(mask.size[::-1])
+
+
+def _blit_glyph(buf: np.ndarray, font: ImageFont.FreeTypeFont, ch: str, x: float, y: float):
+    """
+    Rasterize one glyph straight into a uint8 buffer (same result as ImageDraw.text
+    with fill=255, without the Image -> np.array copy).
+    """
+    # Pillow: integer origin + fractional start, then the mask offset
+    mask, (ox, oy) = font.getmask2(ch, "L", start=(math.modf(x)[0], math.modf(y)[0]))
+    mw, mh = mask.size
+    if mw == 0 or mh == 0:
+        return
+    gx, gy = int(x) + ox, int(y) + oy
+    bx0, by0 = max(gx, 0), max(gy, 0)
+    bx1, by1 = min(gx + mw, buf.shape[1]), min(gy + mh, buf.shape[0])
+    if bx0 >= bx1 or by0 >= by1:
+        return
+
+    m = _mask_array(mask)[by0 - gy:by1 - gy, bx0 - gx:bx1 - gx]
+    dst = buf[by0:by1, bx0:bx1]
+    if not dst.any():
+        dst[...] = m
+        return
+    # overlapping glyphs (Thai marks): Pillow's L-mode mask blend,
+    # DIV255(dst*(255-m) + 255*m + 128); fits in uint16
+    m = m.astype(np.uint16)
+    v = dst * (255 - m) + 255 * m + 128
+    dst[...] = ((v >> 8) + v) >> 8
 
 # ---------------------------------------------------------
 # 2) Bitmap -> Polygon/MultiPolygon (WITH holes)
 # ---------------------------------------------------------
 
-def _cnt_to_xy(cnt: np.ndarray, H: int, invert_y: bool) -> list[tuple[float, float]]:
-    pts = cnt.reshape(-1, 2).astype(float)
-    if invert_y:
-        pts[:, 1] = H - pts[:, 1]
-    return [(float(x), float(y)) for x, y in pts]
+def _cnt_to_xy(cnt: np.ndarray, H: int) -> np.ndarray:
+    # (n,1,2) or (n,2) int contour -> (n,2) float64 array; shapely takes ndarrays directly
+    pts = cnt.reshape(-1, 2).astype(np.float64)
+    pts[:, 1] = H - pts[:, 1]  # flip Y
+    return pts
 
 
-def _cnt_to_xy(cnt: np.ndarray, H: int) -> list[tuple[float, float]]:
-    pts = cnt.reshape(-1, 2).astype(float)
-    pts[:, 1] = H - pts[:, 1]  # flip Y
-    return [(float(x), float(y)) for x, y in pts]
+def _chunked_union(polys, k: int = 50):
+    """
+    Cascaded union: union groups of k, then union the partial results.
+    Keeps each GEOS union call small when there are many glyph polygons.
+    """
+    polys = list(polys)
+    while len(polys) > 1:
+        polys = [shapely.unary_union(polys[i:i + k]) for i in range(0, len(polys), k)]
+    return polys[0]
+
+
+def _outer_outlines(geom):
+    """
+    Outer outlines only (same as RETR_EXTERNAL on the bitmap path): fill every
+    part, union so islands that sat inside a counter (®, ©) merge into the
+    part around them, then fill again in case the union closed a new hole.
+    """
+    for _ in range(2):
+        filled = shapely.polygons(shapely.get_exterior_ring(shapely.get_parts(geom)))
+        geom = shapely.union_all(filled)
+    return geom
 
 
 def bitmap_to_polygon(bitmap: np.ndarray, cfg: TextToMeshConfig):
     """
     Convert bitmap (white text on black) -> Polygon/MultiPolygon with holes.
+    cfg.simplify_tol is the pixel-space tolerance of the only Douglas-Peucker
+    pass (cv2.approxPolyDP); there is no second shapely simplify.
+    cfg.holes=False traces outer outlines only (RETR_EXTERNAL): solid glyphs.
     """
-    mask = (bitmap > cfg.threshold).astype(np.uint8) * 255
+    _, mask = cv2.threshold(bitmap, cfg.threshold, 255, cv2.THRESH_BINARY)
 
-    kernel = np.ones((3, 3), np.uint8)
-    mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
+    if cfg.morph_close:
+        kernel = np.ones((3, 3), np.uint8)
+        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
 
-    cv2.imwrite("debug_contours.png", mask)
+    if cfg.debug:
+        cv2.imwrite("debug_contours.png", mask)
 
-    contours, hierarchy = cv2.findContours(mask, cv2.RETR_CCOMP, cv2.CHAIN_APPROX_SIMPLE)
+    # Teh-Chin approximation simplifies inside the C tracer.
+    # RETR_EXTERNAL gives the same outer contours without tracing any hole
+    # (no children in the hierarchy, so the loop below just skips them)
+    mode = cv2.RETR_CCOMP if cfg.holes else cv2.RETR_EXTERNAL
+    contours, hierarchy = cv2.findContours(mask, mode, cv2.CHAIN_APPROX_TC89_L1)
     if hierarchy is None or len(contours) == 0:
         raise ValueError("No contours found. Check bitmap/font.")
 
     H = bitmap.shape[0]
     hierarchy = hierarchy[0]  # (n,4): next, prev, child, parent
+    lengths = [cv2.arcLength(c, True) for c in contours]
 
-    polygons: list[Polygon] = []
+    def simplify(i: int) -> np.ndarray:
+        # TC89 output is ~4x shorter than CHAIN_APPROX_SIMPLE, so this pass is cheap;
+        # it still sets the final vertex budget that earcut/extrusion pay for
+        return cv2.approxPolyDP(contours[i], max(cfg.simplify_tol, 0.005 * lengths[i]), True)
+
+    # simplification stays per contour (C call); everything after is batched in shapely
+    rings: list[np.ndarray] = []   # shell first, then its holes
+    ring_poly: list[int] = []      # polygon index of each ring
+    n_polys = 0
 
     for idx, h in enumerate(hierarchy):
         parent = h[3]
         if parent != -1:
             continue  # only outer contours
 
-        outer = contours[idx]
-        if len(outer) < 3:
+        if len(contours[idx]) < 3:
             continue
 
-        eps = 0.005 * cv2.arcLength(outer, True)
-        outer = cv2.approxPolyDP(outer, eps, True)
-        shell = _cnt_to_xy(outer, H)
+        outer = simplify(idx)
+        if len(outer) < 3:
+            continue
+        rings.append(outer.reshape(-1, 2))
+        ring_poly.append(n_polys)
 
-        holes: list[list[tuple[float, float]]] = []
         child = h[2]
         while child != -1:
-            hole_cnt = contours[child]
-            if len(hole_cnt) >= 3:
-                eps_h = 0.005 * cv2.arcLength(hole_cnt, True)
-                hole_cnt = cv2.approxPolyDP(hole_cnt, eps_h, True)
-                holes.append(_cnt_to_xy(hole_cnt, H))
+            if len(contours[child]) >= 3:
+                hole_cnt = simplify(child)
+                if len(hole_cnt) >= 3:
+                    rings.append(hole_cnt.reshape(-1, 2))
+                    ring_poly.append(n_polys)
             child = hierarchy[child][0]  # next sibling
 
-        poly = Polygon(shell, holes)
-        if not poly.is_valid:
-            poly = poly.buffer(0)
+        n_polys += 1
+
+    if not rings:
+        raise ValueError("No valid polygons built from contours.")
+
+    pts = _cnt_to_xy(np.concatenate(rings), H)  # flip Y once, for all rings
+    ring_ids = np.repeat(np.arange(len(rings)), [len(r) for r in rings])
+
+    polys = shapely.polygons(
+        shapely.linearrings(pts, indices=ring_ids),
+        indices=np.asarray(ring_poly),
+    )
 
-        if not poly.is_empty and poly.area > 50:
-            polygons.append(poly)
+    invalid = ~shapely.is_valid(polys)
+    if invalid.any():
+        polys[invalid] = shapely.buffer(polys[invalid], 0)
 
-    if not polygons:
+    polys = polys[~shapely.is_empty(polys) & (shapely.area(polys) > 50)]
+    if len(polys) == 0:
         raise ValueError("No valid polygons built from contours.")
 
-    geom = unary_union(polygons)
+    if cfg.force_union:
+        return _chunked_union(polys)
+
+    # RETR_CCOMP outer contours are separate connected components -> already disjoint,
+    # so the union would only rebuild the same MultiPolygon.
+    polys = shapely.get_parts(polys)  # buffer(0) repair may have produced MultiPolygons
+
+    if len(polys) == 1:
+        return polys[0]
+    return MultiPolygon(list(polys))
+
 
-    if cfg.simplify_tol and cfg.simplify_tol > 0:
-        geom = geom.simplify(cfg.simplify_tol, preserve_topology=True)
+# ---------------------------------------------------------
+# 2b) Text -> Polygon directly from font outlines (optional)
+# ---------------------------------------------------------
 
+def _bezier_points(ctrl: np.ndarray, tol: float) -> np.ndarray:
+    """
+    Flatten one quadratic/cubic Bezier segment (ctrl: (3,2) or (4,2)) to points,
+    excluding the start point. Segment count comes from the flatness bound.
+    """
+    d2 = ctrl[:-2] - 2.0 * ctrl[1:-1] + ctrl[2:]
+    dd = float(np.max(np.linalg.norm(d2, axis=1)))
+    k = 0.25 if len(ctrl) == 3 else 0.75
+    n = int(np.clip(np.ceil(np.sqrt(k * dd / max(tol, 1e-6))), 1, 64))
+
+    s = np.linspace(0.0, 1.0, n + 1)[1:, None]
+    u = 1.0 - s
+    if len(ctrl) == 3:
+        return u * u * ctrl[0] + 2 * u * s * ctrl[1] + s * s * ctrl[2]
+    return (
+        u ** 3 * ctrl[0]
+        + 3 * u * u * s * ctrl[1]
+        + 3 * u * s * s * ctrl[2]
+        + s ** 3 * ctrl[3]
+    )
+
+
+def _glyph_rings(outline, tol: float) -> list[np.ndarray]:
+    rings: list[list[np.ndarray]] = []
+
+    def _xy(v) -> np.ndarray:
+        return np.array([[v.x / 64.0, v.y / 64.0]])  # 26.6 fixed point -> px
+
+    def move_to(a, ctx):
+        ctx.append([_xy(a)])
+        return 0
+
+    def line_to(a, ctx):
+        ctx[-1].append(_xy(a))
+        return 0
+
+    def conic_to(a, b, ctx):
+        ctrl = np.vstack([ctx[-1][-1][-1:], _xy(a), _xy(b)])
+        ctx[-1].append(_bezier_points(ctrl, tol))
+        return 0
+
+    def cubic_to(a, b, c, ctx):
+        ctrl = np.vstack([ctx[-1][-1][-1:], _xy(a), _xy(b), _xy(c)])
+        ctx[-1].append(_bezier_points(ctrl, tol))
+        return 0
+
+    outline.decompose(rings, move_to=move_to, line_to=line_to, conic_to=conic_to, cubic_to=cubic_to)
+    return [np.vstack(r) for r in rings if sum(len(p) for p in r) >= 3]
+
+
+def _signed_area(ring: np.ndarray) -> float:
+    x, y = ring[:, 0], ring[:, 1]
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+
+
+def _rings_to_geom(rings: list[np.ndarray]):
+    """
+    Resolve glyph contours to filled area (non-zero rule, common cases):
+    rings sharing the orientation of the largest ring fill, the others cut holes.
+    Applied largest-first so islands inside holes are added back.
+    """
+    polys = [Polygon(r) for r in rings]
+    polys = [p if p.is_valid else p.buffer(0) for p in polys]
+    signed = np.array([_signed_area(r) for r in rings])
+    order = np.argsort(-np.abs(signed))
+    fill_sign = np.sign(signed[order[0]])
+
+    geom = Polygon()
+    for i in order:
+        if np.sign(signed[i]) == fill_sign:
+            geom = geom.union(polys[i])
+        else:
+            geom = geom.difference(polys[i])
     return geom
 
 
+def text_to_polygons_vector(text: str, font_path: str, size: int, tol: float = 0.5, force_union: bool = False):
+    """
+    Build Polygon/MultiPolygon straight from the font's glyph outlines (freetype-py),
+    one line, advance-based layout, in pixel units at `size`.
+    Raises ImportError without freetype-py, ValueError for text this path can't
+    handle (Thai marks need the bitmap layout, glyphs missing from the font).
+    """
+    if freetype is None:
+        raise ImportError("freetype-py is not installed")
+    if any(_is_thai(ch) for ch in text):
+        raise ValueError("Thai text uses the bitmap path")
+
+    face = freetype.Face(font_path)
+    face.set_char_size(int(size) * 64)  # 72 dpi -> 1pt == 1px, same as ImageFont.truetype
+
+    glyphs = []
+    pen_x = 0.0
+    for ch in text:
+        if ch == "\n":
+            ch = " "
+        if not ch.isspace() and face.get_char_index(ch) == 0:
+            raise ValueError(f"Glyph missing in font: {ch!r}")
+
+        face.load_char(ch, freetype.FT_LOAD_NO_BITMAP)
+        rings = _glyph_rings(face.glyph.outline, tol)
+        if rings:
+            g = _rings_to_geom(rings)
+            if not g.is_empty:
+                glyphs.append(shapely.transform(g, lambda xy, dx=pen_x: xy + (dx, 0.0)))
+        pen_x += face.glyph.advance.x / 64.0
+
+    polys = shapely.get_parts(np.array(glyphs, dtype=object))
+    polys = polys[shapely.area(polys) > 0] if len(polys) else polys
+    if len(polys) == 0:
+        raise ValueError("No glyph outlines found for text.")
+
+    if force_union:
+        return _chunked_union(polys)
+    if len(polys) == 1:
+        return polys[0]
+    return MultiPolygon(list(polys))
+
+
 # ---------------------------------------------------------
 # 3) Polygon -> Mesh
 # ---------------------------------------------------------
 
-def polygon_to_extruded_mesh(poly, extrude_depth: float) -> trimesh.Trimesh:
+def _extrude_arrays(p: Polygon, height: float) -> tuple[np.ndarray, np.ndarray]:
+    """Extrude one polygon to raw (vertices, faces); caps share vertices with the walls."""
+    # earcut directly on the ring coordinates (closing point dropped)
+    coords = [shapely.get_coordinates(r)[:-1] for r in (p.exterior, *p.interiors)]
+    v2 = np.concatenate(coords)
+    ends = np.cumsum([len(c) for c in coords]).astype(np.uint32)
+    f2 = triangulate_float64(v2, ends).reshape(-1, 3).astype(np.int64)
+    # drop vertices the triangulation doesn't reference (earcut filters collinear/duplicate points)
+    keep, f2 = np.unique(f2, return_inverse=True)
+    v2, f2 = v2[keep], f2.reshape(-1, 3)
+
+    # wind the cap counter-clockwise (+Z normal)
+    e1 = v2[f2[:, 1]] - v2[f2[:, 0]]
+    e2 = v2[f2[:, 2]] - v2[f2[:, 0]]
+    if (e1[:, 0] * e2[:, 1] - e1[:, 1] * e2[:, 0]).sum() < 0:
+        f2 = f2[:, ::-1]
+
+    n = len(v2)
+    verts = np.empty((2 * n, 3), dtype=np.float64)
+    verts[:n, :2] = v2
+    verts[:n, 2] = 0.0
+    verts[n:, :2] = v2
+    verts[n:, 2] = height
+
+    # boundary edges (outer ring + holes) are the ones used by a single triangle;
+    # taken from the triangulation so they match its vertex indices exactly
+    edges = f2[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2)
+    _, inv, counts = np.unique(np.sort(edges, axis=1), axis=0, return_inverse=True, return_counts=True)
+    a, b = edges[counts[inv.ravel()] == 1].T
+    walls = np.concatenate([
+        np.column_stack([a, b, b + n]),
+        np.column_stack([a, b + n, a + n]),
+    ])
+
+    faces = np.concatenate([f2[:, ::-1], f2 + n, walls])
+    return verts, faces
+
+
+def _extruded_arrays(poly, extrude_depth: float):
+    """Extrude Polygon/MultiPolygon -> stacked (vertices, faces) arrays."""
     if poly.is_empty:
         raise ValueError("Empty polygon")
 
@@ -396,42 +689,155 @@ def polygon_to_extruded_mesh(poly, extrude_depth: float) -> trimesh.Trimesh:
     else:
         raise TypeError(f"Unsupported geometry type: {type(poly)}")
 
-    meshes: list[trimesh.Trimesh] = []
-    for p in polys:
-        if p.is_empty or p.area <= 0:
-            continue
-        meshes.append(trimesh.creation.extrude_polygon(p, extrude_depth))
+    polys = [p for p in polys if not p.is_empty and p.area > 0]
+
+    # serial on purpose: the earcut binding holds the GIL, so a thread pool
+    # only adds overhead (measured slower for 9-78 glyph polygons)
+    parts = [_extrude_arrays(p, extrude_depth) for p in polys]
 
-    if not meshes:
+    if not parts:
         raise ValueError("No valid polygon to extrude")
 
-    mesh = trimesh.util.concatenate(meshes)
-    mesh.vertices -= mesh.center_mass
-    return mesh
+    # single build: offset face indices and stack, no intermediate Trimesh objects
+    offsets = np.cumsum([0] + [len(v) for v, _ in parts[:-1]])
+    V = np.vstack([v for v, _ in parts])
+    F = np.vstack([f + o for (_, f), o in zip(parts, offsets)])
+    return V, F
+
+
+def _center_and_scale(V: np.ndarray, target_height: float | None = None) -> np.ndarray:
+    """
+    In place: center on the AABB center, then (optionally) scale so the Y extent
+    equals target_height. One min/max pass, no trimesh cache involved.
+    Returns the new extents (the bounds are now -ext/2 .. ext/2).
+    """
+    lo, hi = V.min(axis=0), V.max(axis=0)
+    V -= (lo + hi) * 0.5
+    ext = hi - lo
+    h = float(ext[1])
+    if target_height is not None and h > 0:
+        V *= target_height / h
+        ext *= target_height / h
+    return ext
+
+
+def _planar_uv(xy: np.ndarray, mn: np.ndarray, size: np.ndarray) -> np.ndarray:
+    # float32 UVs written straight into one preallocated array
+    uv = np.empty((len(xy), 2), dtype=np.float32)
+    np.subtract(xy, mn, out=uv)
+    uv /= np.maximum(size, 1e-6)
+    return uv
+
+
+def polygon_to_extruded_mesh(poly, extrude_depth: float) -> trimesh.Trimesh:
+    V, F = _extruded_arrays(poly, extrude_depth)
+    _center_and_scale(V)
+    return trimesh.Trimesh(vertices=V, faces=F, process=False)
 
 
 def normalize_height(mesh: trimesh.Trimesh, target_height: float = 1.0) -> trimesh.Trimesh:
     ext = mesh.extents  # [x,y,z]
     h = float(ext[1])
     if h > 0:
-        mesh.apply_scale(target_height / h)
+        mesh.vertices *= target_height / h  # in place; trimesh invalidates its cache
     return mesh
 
 
 def add_planar_uv(mesh: trimesh.Trimesh) -> trimesh.Trimesh:
     xy = mesh.vertices[:, :2]
     mn = xy.min(axis=0)
-    mx = xy.max(axis=0)
-    size = np.maximum(mx - mn, 1e-6)
-    uv = (xy - mn) / size
-    mesh.visual.uv = uv
+    mesh.visual.uv = _planar_uv(xy, mn, xy.max(axis=0) - mn)
     return mesh
 
 
+# ---------------------------------------------------------
+# 3b) On-disk mesh cache (vertices/faces/uv as .npz)
+# ---------------------------------------------------------
+
+_MESH_CACHE_VERSION = 2  # bump when the pipeline output changes
+
+
+def _mesh_cache_path(text: str, cfg: TextToMeshConfig, target_height: float) -> str:
+    cache_dir = os.environ.get("TEXT3D_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "text3d"
+    )
+
+    def stamp(path):
+        try:
+            st = os.stat(path)
+            return path, st.st_mtime_ns, st.st_size
+        except (OSError, TypeError):
+            return path, None
+
+    # the thai/jp fallback faces render those glyphs too, so they are part of the key
+    fonts = tuple(stamp(p) for p in (cfg.font_path, _SCRIPT_FONT["thai"], _SCRIPT_FONT["jp"]))
+    key = repr((
+        _MESH_CACHE_VERSION, text, fonts, cfg.font_size,
+        tuple(cfg.image_size), cfg.extrude_depth, cfg.threshold, cfg.simplify_tol,
+        cfg.force_union, cfg.morph_close, cfg.vector_outlines, cfg.fit_to_image,
+        cfg.holes, target_height,
+    ))
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(cache_dir, digest + ".npz")
+
+
+def _load_cached_mesh(path: str) -> trimesh.Trimesh | None:
+    try:
+        with np.load(path) as z:
+            mesh = trimesh.Trimesh(vertices=z["vertices"], faces=z["faces"], process=False)
+            mesh.visual.uv = z["uv"]
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return None  # missing or unreadable -> rebuild
+    return mesh
+
+
+def _save_cached_mesh(path: str, mesh: trimesh.Trimesh) -> None:
+    tmp = None
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # unique temp name per writer (threads/processes), then atomic rename:
+        # readers never see a partial file
+        with tempfile.NamedTemporaryFile(dir=os.path.dirname(path), suffix=".tmp", delete=False) as fh:
+            tmp = fh.name
+            np.savez(fh, vertices=mesh.vertices, faces=mesh.faces, uv=mesh.visual.uv)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"[INFO] mesh cache not written ({e})")
+        if tmp and os.path.exists(tmp):
+            os.remove(tmp)
+
+
 # ---------------------------------------------------------
 # 4) main API
 # ---------------------------------------------------------
 
+def _build_mesh(text: str, cfg: TextToMeshConfig, target_height: float) -> trimesh.Trimesh:
+    poly = None
+    if cfg.vector_outlines:
+        try:
+            poly = text_to_polygons_vector(
+                text, cfg.font_path, cfg.font_size, tol=cfg.simplify_tol, force_union=cfg.force_union
+            )
+        except (ImportError, ValueError) as e:
+            print(f"[INFO] vector outlines unavailable ({e}); using bitmap path")
+        if poly is not None and not cfg.holes:
+            poly = _outer_outlines(poly)
+
+    if poly is None:
+        bitmap = text_to_bitmap(text, cfg)
+        if cfg.debug:
+            Image.fromarray(bitmap).save("debug_bitmap.png")
+        poly = bitmap_to_polygon(bitmap, cfg)
+
+    # center + normalize height on the raw arrays, then build the Trimesh once;
+    # the XY bounds are known from that pass, so UVs need no extra min/max
+    V, F = _extruded_arrays(poly, cfg.extrude_depth)
+    ext = _center_and_scale(V, target_height)[:2]
+    mesh = trimesh.Trimesh(vertices=V, faces=F, process=False)
+    mesh.visual.uv = _planar_uv(V[:, :2], -0.5 * ext, ext)
+    return mesh
+
+
 def text_to_mesh(
     text: str,
     font_path: str,
@@ -441,6 +847,13 @@ def text_to_mesh(
     extrude_depth: float = 1.0,
     simplify_tol: float = 0.5,
     target_height: float = 1.0,
+    force_union: bool = False,
+    debug: bool = False,
+    vector_outlines: bool = False,
+    morph_close: bool = False,
+    use_cache: bool = False,
+    fit_to_image: bool = True,
+    holes: bool = True,
 ) -> trimesh.Trimesh:
     cfg = TextToMeshConfig(
         font_path=font_path,
@@ -448,16 +861,21 @@ def text_to_mesh(
         image_size=image_size,
         extrude_depth=extrude_depth,
         simplify_tol=simplify_tol,
+        force_union=force_union,
+        debug=debug,
+        vector_outlines=vector_outlines,
+        morph_close=morph_close,
+        use_cache=use_cache,
+        fit_to_image=fit_to_image,
+        holes=holes,
     )
 
-    bitmap = text_to_bitmap(text, cfg)
-    Image.fromarray(bitmap).save("debug_bitmap.png")
-
-    poly = bitmap_to_polygon(bitmap, cfg)
-    mesh = polygon_to_extruded_mesh(poly, extrude_depth)
-
-    mesh = normalize_height(mesh, target_height=target_height)
-    mesh = add_planar_uv(mesh)
+    cache_path = _mesh_cache_path(text, cfg, target_height) if cfg.use_cache else None
+    mesh = _load_cached_mesh(cache_path) if cache_path else None
+    if mesh is None:
+        mesh = _build_mesh(text, cfg, target_height)
+        if cache_path:
+            _save_cached_mesh(cache_path, mesh)
 
     if output_path:
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+import trimesh
+
+pytest.importorskip("manifold3d")
+
+from text3d.embed_text_glb import _manifold_boolean, deform_text_mesh_to_surface
+
+
+def _red_sphere() -> trimesh.Trimesh:
+    base = trimesh.creation.icosphere(subdivisions=3, radius=10.0)
+    base.visual = trimesh.visual.TextureVisuals(
+        material=trimesh.visual.material.PBRMaterial(baseColorFactor=(255, 0, 0, 255))
+    )
+    return base
+
+
+def _tool(base: trimesh.Trimesh, mode: str) -> trimesh.Trimesh:
+    # same path as embed_text_on_glb: a centered slab deformed onto the surface
+    text_local = trimesh.creation.box(extents=(4.0, 2.0, 1.0))
+    return deform_text_mesh_to_surface(
+        base,
+        text_local,
+        p=np.array([0.0, 0.0, 10.0]),
+        n=np.array([0.0, 0.0, 1.0]),
+        t=np.array([1.0, 0.0, 0.0]),
+        b=np.array([0.0, 1.0, 0.0]),
+        lift=2.0,
+        mode=mode,
+    )
+
+
+@pytest.mark.parametrize("mode, sign", [("emboss", 1.0), ("engrave", -1.0)])
+def test_manifold_boolean_volume_and_material(mode, sign):
+    base = _red_sphere()
+    tool = _tool(base, mode)
+    if mode == "engrave":
+        assert tool.volume < 0  # sign=-1 mirrors the slab -> inside-out tool
+
+    out = _manifold_boolean(base, tool, mode)
+
+    assert out is not None
+    assert sign * (out.volume - base.volume) > 0.5
+    assert isinstance(out.visual, trimesh.visual.TextureVisuals)
+    assert tuple(out.visual.material.baseColorFactor) == (255, 0, 0, 255)